@@ -7,6 +7,7 @@ from datetime import timedelta
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import requests
 from aind_data_schema.components.devices import Software
@@ -126,7 +127,7 @@ class Camstim:
         behavior_table = behavior_utils.from_stimulus_file(
             self.pkl_path, timestamps
         )
-        behavior_table[0].to_csv(self.stim_table_path, index=False)
+        self._write_stim_table(behavior_table[0])
 
     def get_session_uuid(self) -> str:
         """Returns the session uuid from the pickle file"""
@@ -235,67 +236,78 @@ class Camstim:
             stim_table_seconds, column_name_map, ignore_case=False
         )
 
-        stim_table_final.to_csv(self.stim_table_path, index=False)
+        self._write_stim_table(stim_table_final)
+
+    def _write_stim_table(self, stim_table: pd.DataFrame) -> None:
+        """Writes a stimulus table to the session's stim table csv file"""
+        stim_table.to_csv(self.stim_table_path, index=False)
 
     def extract_stim_epochs(
         self, stim_table: pd.DataFrame
     ) -> list[list[str, int, int, dict, set]]:
         """
         Returns a list of stimulus epochs, where an epoch takes the form
-        (name, start, stop, params_dict, template names). Iterates over the
-        stimulus epochs table, identifying epochs based on when the
-        'stim_name' field of the table changes.
+        (name, start, stop, params_dict, template names). Epochs are
+        identified by finding the rows where the 'stim_name' field of the
+        stimulus epochs table changes.
 
         For each epoch, every unknown column (not start_time, stop_time,
         stim_name, stim_type, or frame) are listed as parameters, and the set
         of values for that column are listed as parameter values.
         """
-        epochs = []
+        param_columns = [
+            column
+            for column in stim_table
+            if column
+            not in (
+                "start_time",
+                "stop_time",
+                "stim_name",
+                "stim_type",
+                "frame",
+            )
+        ]
 
-        current_epoch = [None, 0.0, 0.0, {}, set()]
-        epoch_start_idx = 0
-        for current_idx, row in stim_table.iterrows():
-            # if the stim name changes, summarize current epoch's parameters
-            # and start a new epoch
-            if row["stim_name"] != current_epoch[0]:
-                for column in stim_table:
-                    if column not in (
-                        "start_time",
-                        "stop_time",
-                        "stim_name",
-                        "stim_type",
-                        "frame",
-                    ):
-                        param_set = set(
-                            stim_table[column][
-                                epoch_start_idx:current_idx
-                            ].dropna()
-                        )
-                        current_epoch[3][column] = param_set
-                epochs.append(current_epoch)
-                epoch_start_idx = current_idx
-                current_epoch = [
-                    row["stim_name"],
-                    row["start_time"],
-                    row["stop_time"],
-                    {},
-                    set(),
+        # an epoch starts on every row whose stim name differs from the
+        # previous row's, so find all epoch boundaries in one pass
+        stim_names = stim_table["stim_name"].to_numpy(dtype=object)
+        is_epoch_start = np.ones(len(stim_names), dtype=bool)
+        is_epoch_start[1:] = stim_names[1:] != stim_names[:-1]
+        epoch_starts = np.flatnonzero(is_epoch_start)
+        start_times = stim_table["start_time"].tolist()
+        stop_times = stim_table["stop_time"].tolist()
+
+        epochs = []
+        # the last epoch is never closed by a stim name change, so it is
+        # not reported
+        for epoch_start_idx, epoch_end_idx in zip(
+            epoch_starts[:-1], epoch_starts[1:]
+        ):
+            epoch_rows = stim_table.iloc[epoch_start_idx:epoch_end_idx]
+
+            stim_params = {
+                column: set(epoch_rows[column].dropna())
+                for column in param_columns
+            }
+
+            # if this epoch is a movie or image set, record it's stim name
+            # in the epoch's templates entry
+            stim_templates = set()
+            stim_name = stim_names[epoch_start_idx]
+            lower_name = "" if pd.isnull(stim_name) else stim_name.lower()
+            if "image" in lower_name or "movie" in lower_name:
+                stim_templates.add(stim_name)
+
+            epochs.append(
+                [
+                    stim_name,
+                    start_times[epoch_start_idx],
+                    stop_times[epoch_end_idx - 1],
+                    stim_params,
+                    stim_templates,
                 ]
-            # if stim name hasn't changed, we are in the same epoch, keep
-            # pushing the stop time
-            else:
-                current_epoch[2] = row["stop_time"]
-
-            # if this row is a movie or image set, record it's stim name in
-            # the epoch's templates entry
-            stim_name = row.get("stim_name", "")
-            if pd.isnull(stim_name):
-                stim_name = ""
-
-            if "image" in stim_name.lower() or "movie" in stim_name.lower():
-                current_epoch[4].add(row["stim_name"])
-        # slice off dummy epoch from beginning
-        return epochs[1:]
+            )
+        return epochs
 
     def epochs_from_stim_table(self) -> list[StimulusEpoch]:
         """
@@ -1,5 +1,6 @@
 """Test U19 ETL class."""
 
+import copy
 import json
 import os
 import unittest
@@ -48,6 +49,12 @@ class TestU19Writer(unittest.TestCase):
 
         with open(EXAMPLE_OUTPUT, "r") as f:
             self.example_output = json.load(f)
+        self.expected_procedures = construct_new_model(
+            self.example_output, Procedures, True
+        )
+
+        with open(EXAMPLE_DOWNLOAD_PROCEDURE, "r") as f:
+            self.example_download_procedure = json.load(f)
 
         self.example_job_settings = JobSettings(
             input_source=EXAMPLE_TISSUE_SHEET,
@@ -61,6 +68,11 @@ class TestU19Writer(unittest.TestCase):
             allow_validation_errors=True,
         )
 
+        # Parsing the tissue sheets dominates this class's runtime, so the
+        # tests that only read from the sheets share one loaded ETL
+        self.etl = SmartSPIMSpecimenIngester(self.example_job_settings)
+        self.etl.load_specimen_procedure_file()
+
     @patch(
         "aind_metadata_mapper.u19.procedures."
         "SmartSPIMSpecimenIngester.download_procedure_file"
@@ -68,14 +80,16 @@ class TestU19Writer(unittest.TestCase):
     def test_run_job(self, mock_download_procedure):
         """Test run_job method."""
 
-        with open(EXAMPLE_DOWNLOAD_PROCEDURE, "r") as f:
-            mock_download_procedure.return_value = json.load(f)
+        mock_download_procedure.return_value = copy.deepcopy(
+            self.example_download_procedure
+        )
 
         etl = SmartSPIMSpecimenIngester(self.example_job_settings)
         job_response = etl.run_job()
 
         actual_output = json.loads(job_response.data)
 
+        self.assertEqual(self.example_output.keys(), actual_output.keys())
         self.assertEqual(self.example_output, actual_output)
 
     @patch(
@@ -85,8 +99,9 @@ class TestU19Writer(unittest.TestCase):
     def test_extract(self, mock_download_procedure):
         """Test extract method."""
 
-        with open(EXAMPLE_DOWNLOAD_PROCEDURE, "r") as f:
-            mock_download_procedure.return_value = json.load(f)
+        mock_download_procedure.return_value = copy.deepcopy(
+            self.example_download_procedure
+        )
 
         etl = SmartSPIMSpecimenIngester(self.example_job_settings)
         extracted = etl._extract(self.example_job_settings.subject_to_ingest)
@@ -99,23 +114,16 @@ class TestU19Writer(unittest.TestCase):
     def test_transform(self):
         """Test transform method."""
 
-        etl = SmartSPIMSpecimenIngester(self.example_job_settings)
-        etl.load_specimen_procedure_file()
-
-        with open(EXAMPLE_DOWNLOAD_PROCEDURE, "r") as f:
-            extracted = json.load(f)
+        # _transform writes specimen_procedures into the dict it is given
+        extracted = copy.deepcopy(self.example_download_procedure)
 
-        transformed = etl._transform(
+        transformed = self.etl._transform(
             extracted, self.example_job_settings.subject_to_ingest
         )
 
         self.assertEqual(
             len(transformed.specimen_procedures),
-            len(
-                construct_new_model(
-                    self.example_output, Procedures, True
-                ).specimen_procedures
-            ),
+            len(self.expected_procedures.specimen_procedures),
         )
 
     @patch(
@@ -125,9 +133,7 @@ class TestU19Writer(unittest.TestCase):
     def test_load(self, mock_transform):
         """Test load method."""
 
-        mock_transform.return_value = construct_new_model(
-            self.example_output, Procedures, True
-        )
+        mock_transform.return_value = self.expected_procedures
 
         etl = SmartSPIMSpecimenIngester(self.example_job_settings)
         transformed = etl._transform(
@@ -140,14 +146,15 @@ class TestU19Writer(unittest.TestCase):
 
         actual_output = json.loads(job_response.data)
 
+        self.assertEqual(self.example_output.keys(), actual_output.keys())
         self.assertEqual(self.example_output, actual_output)
 
     def test_find_sheet_row(self):
         """Test find_sheet_row method."""
 
-        etl = SmartSPIMSpecimenIngester(self.example_job_settings)
-        etl.load_specimen_procedure_file()
-        row = etl.find_sheet_row(self.example_job_settings.subject_to_ingest)
+        row = self.etl.find_sheet_row(
+            self.example_job_settings.subject_to_ingest
+        )
 
         self.assertTrue(row is not None)
 
@@ -175,10 +182,7 @@ class TestU19Writer(unittest.TestCase):
     def test_load_specimen_procedure_file(self):
         """Test load_specimen_procedure_file method."""
 
-        etl = SmartSPIMSpecimenIngester(self.example_job_settings)
-        etl.load_specimen_procedure_file()
-
-        self.assertTrue(len(etl.tissue_sheets) == 2)
+        self.assertTrue(len(self.etl.tissue_sheets) == 2)
 
     def test_strings_to_dates(self):
         """Test strings_to_dates method."""
@@ -197,10 +201,9 @@ class TestU19Writer(unittest.TestCase):
     def test_extract_spec_procedures(self):
         """Test extract_spec_procedures method."""
 
-        etl = SmartSPIMSpecimenIngester(self.example_job_settings)
-        etl.load_specimen_procedure_file()
-
-        row = etl.find_sheet_row(self.example_job_settings.subject_to_ingest)
+        row = self.etl.find_sheet_row(
+            self.example_job_settings.subject_to_ingest
+        )
 
         easyindex_100_date = row["Index matching"]["100% EasyIndex"][
             "Date(s)"
@@ -238,7 +241,7 @@ class TestU19Writer(unittest.TestCase):
             notes=easyindex_notes,
         )
 
-        extracted_procedures = etl.extract_spec_procedures(
+        extracted_procedures = self.etl.extract_spec_procedures(
             self.example_job_settings.subject_to_ingest, row
         )
 
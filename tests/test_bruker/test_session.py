@@ -96,15 +96,15 @@ class TestMRIWriter(unittest.TestCase):
         example_etl = MRIEtl(job_settings=example_job_settings)
         example_model = example_etl._extract()
         cls.example_job_settings = example_job_settings
+        cls.example_job_settings_json = example_job_settings.model_dump_json()
         cls.example_etl = example_etl
         cls.example_model = example_model
 
     def test_constructor_from_string(self) -> None:
         """Test constructor from string."""
 
-        job_settings_string = self.example_job_settings.model_dump_json()
         etl0 = MRIEtl(self.example_job_settings)
-        etl1 = MRIEtl(job_settings_string)
+        etl1 = MRIEtl(self.example_job_settings_json)
 
         self.assertEqual(etl1.job_settings, etl0.job_settings)
 
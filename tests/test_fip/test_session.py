@@ -21,6 +21,8 @@ RESOURCES_DIR = (
 EXAMPLE_MD_PATH = RESOURCES_DIR / "example_from_teensy.txt"
 EXPECTED_SESSION = RESOURCES_DIR / "000000_ophys_session.json"
 
+UTC = zoneinfo.ZoneInfo("UTC")
+
 
 class TestSchemaWriter(unittest.TestCase):
     """Test methods in SchemaWriter class."""
@@ -37,9 +39,7 @@ class TestSchemaWriter(unittest.TestCase):
         cls.example_job_settings = JobSettings(
             string_to_parse=raw_md_contents,
             experimenter_full_name=["Don Key"],
-            session_start_time=datetime(
-                1999, 10, 4, tzinfo=zoneinfo.ZoneInfo("UTC")
-            ),
+            session_start_time=datetime(1999, 10, 4, tzinfo=UTC),
             notes="brabrabrabra....",
             labtracks_id="000000",
             iacuc_protocol="2115",
@@ -86,12 +86,16 @@ class TestSchemaWriter(unittest.TestCase):
         cls.expected_session = Session.model_validate_json(
             json.dumps(expected_session_contents)
         )
+        cls.example_job_settings_json = (
+            cls.example_job_settings.model_dump_json()
+        )
+        cls.etl_job = FIBEtl(job_settings=cls.example_job_settings)
+        cls.parsed_info = cls.etl_job._extract()
 
     def test_constructor_from_string(self) -> None:
         """Tests that the settings can be constructed from a json string"""
-        job_settings_str = self.example_job_settings.model_dump_json()
         etl0 = FIBEtl(
-            job_settings=job_settings_str,
+            job_settings=self.example_job_settings_json,
         )
         etl1 = FIBEtl(
             job_settings=self.example_job_settings,
@@ -102,22 +106,19 @@ class TestSchemaWriter(unittest.TestCase):
         """Tests that the teensy response and experiment
         data is extracted correctly"""
 
-        etl_job1 = FIBEtl(job_settings=self.example_job_settings)
-        parsed_info = etl_job1._extract()
         self.assertEqual(
-            self.example_job_settings.string_to_parse, parsed_info.teensy_str
+            self.example_job_settings.string_to_parse,
+            self.parsed_info.teensy_str,
         )
         self.assertEqual(
-            datetime(1999, 10, 4, tzinfo=zoneinfo.ZoneInfo("UTC")),
+            datetime(1999, 10, 4, tzinfo=UTC),
             self.example_job_settings.session_start_time,
         )
 
     def test_transform(self):
         """Tests that the teensy response maps correctly to ophys session."""
 
-        etl_job1 = FIBEtl(job_settings=self.example_job_settings)
-        parsed_info = etl_job1._extract()
-        actual_session = etl_job1._transform(parsed_info)
+        actual_session = self.etl_job._transform(self.parsed_info)
         self.assertEqual(self.expected_session, actual_session)
 
     def test_run_job(self):
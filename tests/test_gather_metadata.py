@@ -53,6 +53,14 @@ METADATA_DIR_WITH_RIG_ISSUE = RESOURCES_DIR / "schema_files_with_issues"
 EXAMPLE_BERGAMO_CONFIGS = RESOURCES_DIR / "test_bergamo_configs.json"
 
 
+def build_response(status_code: int, body: dict) -> Response:
+    """Build a requests Response with a json body to return from a mock"""
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
 class TestGatherMetadataJob(unittest.TestCase):
     """Tests methods in GatherMetadataJob class"""
 
@@ -134,11 +142,9 @@ class TestGatherMetadataJob(unittest.TestCase):
     @patch("requests.get")
     def test_get_subject(self, mock_get: MagicMock):
         """Tests get_subject method when use service is true"""
-        mock_response = Response()
-        mock_response.status_code = 200
-        body = json.dumps(self.example_subject_response)
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            200, self.example_subject_response
+        )
 
         job_settings = JobSettings(
             metadata_service_domain="http://acme.test",
@@ -155,11 +161,9 @@ class TestGatherMetadataJob(unittest.TestCase):
     @patch("requests.get")
     def test_get_subject_from_dir(self, mock_get: MagicMock):
         """Tests get_subject method when use service is false"""
-        mock_response = Response()
-        mock_response.status_code = 200
-        body = json.dumps(self.example_subject_response)
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            200, self.example_subject_response
+        )
 
         metadata_dir = RESOURCES_DIR / "metadata_files"
         job_settings = JobSettings(
@@ -178,11 +182,9 @@ class TestGatherMetadataJob(unittest.TestCase):
     @patch("requests.get")
     def test_get_subject_error(self, mock_get: MagicMock):
         """Tests get_subject when an error is raised"""
-        mock_response = Response()
-        mock_response.status_code = 500
-        body = json.dumps({"message": "Internal Server Error"})
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            500, {"message": "Internal Server Error"}
+        )
 
         job_settings = JobSettings(
             directory_to_write_to=RESOURCES_DIR,
@@ -203,11 +205,9 @@ class TestGatherMetadataJob(unittest.TestCase):
     @patch("requests.get")
     def test_get_procedures(self, mock_get: MagicMock):
         """Tests get_procedures method"""
-        mock_response = Response()
-        mock_response.status_code = 406
-        body = json.dumps(self.example_procedures_response)
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            406, self.example_procedures_response
+        )
 
         job_settings = JobSettings(
             directory_to_write_to=RESOURCES_DIR,
@@ -224,11 +224,9 @@ class TestGatherMetadataJob(unittest.TestCase):
     @patch("requests.get")
     def test_get_procedures_from_dir(self, mock_get: MagicMock):
         """Tests get_procedures method from dir"""
-        mock_response = Response()
-        mock_response.status_code = 406
-        body = json.dumps(self.example_procedures_response)
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            406, self.example_procedures_response
+        )
         metadata_dir = RESOURCES_DIR / "metadata_files"
         job_settings = JobSettings(
             directory_to_write_to=RESOURCES_DIR,
@@ -249,11 +247,9 @@ class TestGatherMetadataJob(unittest.TestCase):
         self, mock_warn: MagicMock, mock_get: MagicMock
     ):
         """Tests get_procedures when an error is raised"""
-        mock_response = Response()
-        mock_response.status_code = 500
-        body = json.dumps({"message": "Internal Server Error"})
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            500, {"message": "Internal Server Error"}
+        )
 
         job_settings = JobSettings(
             directory_to_write_to=RESOURCES_DIR,
@@ -273,11 +269,9 @@ class TestGatherMetadataJob(unittest.TestCase):
     def test_get_raw_data_description(self, mock_get: MagicMock):
         """Tests get_raw_data_description method with valid model"""
 
-        mock_response = Response()
-        mock_response.status_code = 200
-        body = json.dumps(self.example_funding_response)
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            200, self.example_funding_response
+        )
 
         job_settings = JobSettings(
             directory_to_write_to=RESOURCES_DIR,
@@ -306,11 +300,9 @@ class TestGatherMetadataJob(unittest.TestCase):
     def test_get_raw_data_description_from_dir(self, mock_get: MagicMock):
         """Tests get_raw_data_description method from dir"""
 
-        mock_response = Response()
-        mock_response.status_code = 200
-        body = json.dumps(self.example_funding_response)
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            200, self.example_funding_response
+        )
 
         metadata_dir = RESOURCES_DIR / "metadata_files"
 
@@ -343,11 +335,9 @@ class TestGatherMetadataJob(unittest.TestCase):
         """Tests get_raw_data_description method with valid model and multiple
         items in funding response"""
 
-        mock_response = Response()
-        mock_response.status_code = 300
-        body = json.dumps(self.example_funding_multi_response)
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            300, self.example_funding_multi_response
+        )
 
         job_settings = JobSettings(
             directory_to_write_to=RESOURCES_DIR,
@@ -376,11 +366,9 @@ class TestGatherMetadataJob(unittest.TestCase):
     @patch("requests.get")
     def test_get_raw_data_description_invalid(self, mock_get: MagicMock):
         """Tests get_raw_data_description method with invalid model"""
-        mock_response = Response()
-        mock_response.status_code = 500
-        body = json.dumps({"message": "Internal Server Error"})
-        mock_response._content = body.encode("utf-8")
-        mock_get.return_value = mock_response
+        mock_get.return_value = build_response(
+            500, {"message": "Internal Server Error"}
+        )
 
         job_settings = JobSettings(
             directory_to_write_to=RESOURCES_DIR,
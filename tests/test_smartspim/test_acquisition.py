@@ -23,9 +23,18 @@ from tests.test_smartspim.example_metadata import (
 class TestSmartspimETL(unittest.TestCase):
     """Tests methods in the SmartSPIM class"""
 
-    def setUp(self):
-        """Setting up temporary folder directory"""
-        self.example_job_settings_success = JobSettings(
+    @classmethod
+    def setUpClass(cls):
+        """Build the job settings, ETL jobs and mocked _extract output"""
+        cls.example_extracted_metadata = {
+            "session_config": example_metadata_info["session_config"],
+            "wavelength_config": example_metadata_info["wavelength_config"],
+            "tile_config": example_metadata_info["tile_config"],
+            "session_end_time": example_session_end_time,
+            "filter_mapping": example_filter_mapping,
+            "processing_manifest": example_processing_manifest,
+        }
+        cls.example_job_settings_success = JobSettings(
             subject_id="000000",
             input_source="SmartSPIM_000000_2024-10-10_10-10-10",
             output_directory="output_folder",
@@ -33,11 +42,11 @@ class TestSmartspimETL(unittest.TestCase):
             mdata_filename_json="derivatives/metadata.json",
             processing_manifest_path="derivatives/processing_manifest.json",
         )
-        self.example_smartspim_etl_success = SmartspimETL(
-            job_settings=self.example_job_settings_success
+        cls.example_smartspim_etl_success = SmartspimETL(
+            job_settings=cls.example_job_settings_success
         )
 
-        self.example_job_settings_fail_mouseid = JobSettings(
+        cls.example_job_settings_fail_mouseid = JobSettings(
             subject_id="00000",
             input_source="SmartSPIM_00000_2024-10-10_10-10-10",
             output_directory="output_folder",
@@ -45,8 +54,8 @@ class TestSmartspimETL(unittest.TestCase):
             mdata_filename_json="derivatives/metadata.json",
             processing_manifest_path="derivatives/processing_manifest.json",
         )
-        self.example_smartspim_etl_fail_mouseid = SmartspimETL(
-            job_settings=self.example_job_settings_fail_mouseid
+        cls.example_smartspim_etl_fail_mouseid = SmartspimETL(
+            job_settings=cls.example_job_settings_fail_mouseid
         )
 
     def test_class_constructor(self):
@@ -61,39 +70,16 @@ class TestSmartspimETL(unittest.TestCase):
     @patch("aind_metadata_mapper.smartspim.acquisition.SmartspimETL._extract")
     def test_extract(self, mock_extract: MagicMock):
         """Tests the extract private method inside the ETL"""
-        mock_extract.return_value = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
-            "processing_manifest": example_processing_manifest,
-        }
+        mock_extract.return_value = self.example_extracted_metadata
 
         result = self.example_smartspim_etl_success._extract()
 
-        expected_result = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
-            "processing_manifest": example_processing_manifest,
-        }
-
-        self.assertEqual(expected_result, result)
+        self.assertEqual(self.example_extracted_metadata, result)
 
     @patch("aind_metadata_mapper.smartspim.acquisition.SmartspimETL._extract")
     def test_transform(self, mock_extract: MagicMock):
         """Tests the transformation that cretes the acquisition.json"""
-        mock_extract.return_value = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
-            "processing_manifest": example_processing_manifest,
-        }
+        mock_extract.return_value = self.example_extracted_metadata
 
         test_extracted = self.example_smartspim_etl_success._extract()
 
@@ -105,14 +91,7 @@ class TestSmartspimETL(unittest.TestCase):
     @patch("aind_metadata_mapper.smartspim.acquisition.SmartspimETL._extract")
     def test_transform_fail_mouseid(self, mock_extract: MagicMock):
         """Tests when the mouse id is not a valid one"""
-        mock_extract.return_value = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
-            "processing_manifest": example_processing_manifest,
-        }
+        mock_extract.return_value = self.example_extracted_metadata
 
         test_extracted = self.example_smartspim_etl_fail_mouseid._extract()
 
@@ -131,11 +110,7 @@ class TestSmartspimETL(unittest.TestCase):
             "axes"
         ] = None
         mock_extract_fail_axes.return_value = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
+            **self.example_extracted_metadata,
             "processing_manifest": example_processing_manifest_axes_none,
         }
 
@@ -160,11 +135,7 @@ class TestSmartspimETL(unittest.TestCase):
             "chamber_immersion"
         ] = None
         mock_extracted_fail_immersion.return_value = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
+            **self.example_extracted_metadata,
             "processing_manifest": example_processing_manifest_immersion,
         }
 
@@ -177,65 +148,29 @@ class TestSmartspimETL(unittest.TestCase):
                 metadata_dict=test_extracted_fail_immersion
             )
 
-    @patch("aind_metadata_mapper.smartspim.acquisition.SmartspimETL._extract")
-    def test_transform_other_chamber_medium(
-        self, mock_extracted_other_immersion: MagicMock
-    ):
-        """Tests when the immersion is not provided"""
-        example_processing_manifest_immersion = copy.deepcopy(
-            example_processing_manifest
-        )
-        example_processing_manifest_immersion["prelim_acquisition"][
-            "chamber_immersion"
-        ]["medium"] = "unknown"
-
-        mock_extracted_other_immersion.return_value = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
-            "processing_manifest": example_processing_manifest_immersion,
-        }
-
-        test_extracted_other_immersion = (
-            self.example_smartspim_etl_success._extract()
-        )
-
-        result = self.example_smartspim_etl_success._transform(
-            metadata_dict=test_extracted_other_immersion
-        )
-        self.assertEqual(acquisition.Acquisition, type(result))
-
-    @patch("aind_metadata_mapper.smartspim.acquisition.SmartspimETL._extract")
-    def test_transform_other_sample_medium(
-        self, mock_extracted_other_immersion: MagicMock
-    ):
-        """Tests when the sample immersion is not provided"""
-        example_processing_manifest_immersion = copy.deepcopy(
-            example_processing_manifest
-        )
-        example_processing_manifest_immersion["prelim_acquisition"][
-            "sample_immersion"
-        ]["medium"] = "Cargille"
-
-        mock_extracted_other_immersion.return_value = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
-            "processing_manifest": example_processing_manifest_immersion,
-        }
-
-        test_extracted_other_immersion = (
-            self.example_smartspim_etl_success._extract()
-        )
-
-        result = self.example_smartspim_etl_success._transform(
-            metadata_dict=test_extracted_other_immersion
-        )
-        self.assertEqual(acquisition.Acquisition, type(result))
+    def test_transform_other_immersion_medium(self):
+        """Tests when the chamber or sample immersion medium is not oil"""
+        for immersion, medium in [
+            ("chamber_immersion", "unknown"),
+            ("sample_immersion", "Cargille"),
+        ]:
+            with self.subTest(immersion=immersion, medium=medium):
+                example_processing_manifest_immersion = copy.deepcopy(
+                    example_processing_manifest
+                )
+                example_processing_manifest_immersion["prelim_acquisition"][
+                    immersion
+                ]["medium"] = medium
+
+                result = self.example_smartspim_etl_success._transform(
+                    metadata_dict={
+                        **self.example_extracted_metadata,
+                        "processing_manifest": (
+                            example_processing_manifest_immersion
+                        ),
+                    }
+                )
+                self.assertEqual(acquisition.Acquisition, type(result))
 
     @patch("aind_metadata_mapper.smartspim.acquisition.SmartspimETL._extract")
     @patch("aind_data_schema.base.AindCoreModel.write_standard_file")
@@ -243,14 +178,7 @@ class TestSmartspimETL(unittest.TestCase):
         self, mock_file_write: MagicMock, mock_extract: MagicMock
     ):
         """Tests the run job method that creates the acquisition"""
-        mock_extract.return_value = {
-            "session_config": example_metadata_info["session_config"],
-            "wavelength_config": example_metadata_info["wavelength_config"],
-            "tile_config": example_metadata_info["tile_config"],
-            "session_end_time": example_session_end_time,
-            "filter_mapping": example_filter_mapping,
-            "processing_manifest": example_processing_manifest,
-        }
+        mock_extract.return_value = self.example_extracted_metadata
 
         response = self.example_smartspim_etl_success.run_job()
         mock_file_write.assert_called_once()
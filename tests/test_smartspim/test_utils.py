@@ -14,30 +14,26 @@ from tests.test_smartspim.example_metadata import (
     example_metadata_info,
 )
 
+RESOURCES_DIR = (
+    Path(os.path.dirname(os.path.realpath(__file__)))
+    / ".."
+    / "resources"
+    / "smartspim"
+)
+LOCAL_JSON_PATH = RESOURCES_DIR / "local_json.json"
+ASI_FILE_PATH_MORNING = RESOURCES_DIR / "example_ASI_logging_morning.txt"
+ASI_FILE_PATH_AFTERNOON = RESOURCES_DIR / "example_ASI_logging_afternoon.txt"
+
 
 class TestSmartspimUtils(unittest.TestCase):
     """Tests methods in the SmartSPIM class"""
 
-    def setUp(self):
-        """Setting up temporary folder directory"""
-        current_path = Path(os.path.abspath(__file__)).parent
-        self.test_local_json_path = current_path.joinpath(
-            "../resources/smartspim/local_json.json"
-        )
-
-        self.test_asi_file_path_morning = current_path.joinpath(
-            "../resources/smartspim/" "example_ASI_logging_morning.txt"
-        )
-        self.test_asi_file_path_afternoon = current_path.joinpath(
-            "../resources/smartspim/" "example_ASI_logging_afternoon.txt"
-        )
-
     def test_read_json_as_dict(self):
         """
         Tests successful reading of a dictionary
         """
         expected_result = {"some_key": "some_value"}
-        result = utils.read_json_as_dict(self.test_local_json_path)
+        result = utils.read_json_as_dict(LOCAL_JSON_PATH)
         self.assertEqual(expected_result, result)
 
     def test_read_json_as_dict_fails(self):
@@ -59,9 +55,10 @@ class TestSmartspimUtils(unittest.TestCase):
             "superior_to_inferior": AnatomicalDirection.SI,
         }
 
-        for str_an_dir, schema_an_dir in an_dirs.items():
-            curr_an_dir = utils.get_anatomical_direction(str_an_dir)
-            self.assertEqual(schema_an_dir, curr_an_dir)
+        self.assertEqual(
+            list(an_dirs.values()),
+            [utils.get_anatomical_direction(an_dir) for an_dir in an_dirs],
+        )
 
     def test_make_acq_tiles_res_none(self):
         """
@@ -79,14 +76,14 @@ class TestSmartspimUtils(unittest.TestCase):
 
     def test_session_end(self):
         """Tests getting the session end time from microscope acquisition"""
-        session_end = utils.get_session_end(self.test_asi_file_path_morning)
+        session_end = utils.get_session_end(ASI_FILE_PATH_MORNING)
         expected_datetime = datetime.strptime(
             "2023-10-19 12:00:55", "%Y-%m-%d %H:%M:%S"
         )
 
         self.assertEqual(expected_datetime, session_end)
 
-        session_end = utils.get_session_end(self.test_asi_file_path_afternoon)
+        session_end = utils.get_session_end(ASI_FILE_PATH_AFTERNOON)
         expected_datetime = datetime.strptime(
             "2023-10-19 0:00:55", "%Y-%m-%d %H:%M:%S"
         )
@@ -10,6 +10,9 @@ from aind_data_schema.base import AindGeneric
 
 from aind_metadata_mapper.stimulus.camstim import Camstim, CamstimSettings
 
+# Shared return value for mocked table builders; none of the tests mutate it
+EXAMPLE_TABLE = pd.DataFrame({"a": [1, 2, 3]})
+
 
 class TestCamstim(unittest.TestCase):
     """Test camstim.py"""
@@ -57,14 +60,10 @@ class TestCamstim(unittest.TestCase):
             dt(2024, 11, 1, 15, 41, 32, 920082),
             dt(2024, 11, 1, 15, 41, 50, 648629),
         )
-        mock_rglob.return_value = iter([Path("some/path/file.pkl")])
-        cls.camstim = Camstim(
-            CamstimSettings(
-                input_source="some/path",
-                output_directory="some/other/path",
-                session_id="1234567890",
-                subject_id="123456",
-            )
+        # Camstim calls next() on rglob's result, so hand out a fresh
+        # iterator on every call rather than a single one-shot iterator
+        mock_rglob.side_effect = lambda pattern: iter(
+            [Path("some/path/file.pkl")]
         )
         cls.camstim_settings = CamstimSettings(
             input_source="some/path",
@@ -72,6 +71,7 @@ class TestCamstim(unittest.TestCase):
             session_id="1234567890",
             subject_id="123456",
         )
+        cls.camstim = Camstim(cls.camstim_settings)
 
     @patch(
         "aind_metadata_mapper.stimulus.camstim.sync.get_ophys_stimulus_timestamps"  # noqa
@@ -79,17 +79,17 @@ class TestCamstim(unittest.TestCase):
     @patch(
         "aind_metadata_mapper.stimulus.camstim.behavior_utils.from_stimulus_file"  # noqa
     )
-    @patch("pandas.DataFrame.to_csv")
+    @patch.object(Camstim, "_write_stim_table")
     def test_build_behavior_table(
         self,
-        mock_to_csv: MagicMock,
+        mock_write_stim_table: MagicMock,
         mock_from_stimulus_file: MagicMock,
         mock_get_ophys_stimulus_timestamps: MagicMock,
     ):
         """Test the build_behavior_table method"""
         # Mock the return values
         mock_get_ophys_stimulus_timestamps.return_value = [1, 2, 3]
-        mock_from_stimulus_file.return_value = [pd.DataFrame({"a": [1, 2, 3]})]
+        mock_from_stimulus_file.return_value = [EXAMPLE_TABLE]
 
         # Call the method
         self.camstim.build_behavior_table()
@@ -101,9 +101,7 @@ class TestCamstim(unittest.TestCase):
         mock_from_stimulus_file.assert_called_once_with(
             self.camstim.pkl_path, [1, 2, 3]
         )
-        mock_to_csv.assert_called_once_with(
-            self.camstim.stim_table_path, index=False
-        )
+        mock_write_stim_table.assert_called_once_with(EXAMPLE_TABLE)
 
     @patch(
         "aind_metadata_mapper.stimulus.camstim.stim_utils.extract_frame_times_from_photodiode"  # noqa
@@ -112,7 +110,7 @@ class TestCamstim(unittest.TestCase):
         "aind_metadata_mapper.stimulus.camstim.stim_utils.create_stim_table"
     )
     @patch("aind_metadata_mapper.stimulus.camstim.names.map_column_names")
-    @patch("pandas.DataFrame.to_csv")
+    @patch.object(Camstim, "_write_stim_table")
     @patch(
         "aind_metadata_mapper.stimulus.camstim.stim_utils.seconds_to_frames"
     )
@@ -129,22 +127,20 @@ class TestCamstim(unittest.TestCase):
         mock_extract_blocks_from_stim: MagicMock,
         mock_get_stimuli: MagicMock,
         mock_seconds_to_frames: MagicMock,
-        mock_to_csv: MagicMock,
+        mock_write_stim_table: MagicMock,
         mock_map_column_names: MagicMock,
         mock_create_stim_table: MagicMock,
         mock_extract_frame_times_from_photodiode: MagicMock,
     ):
         """Test the build_stimulus_table method"""
         # Mock the return values
-        mock_get_stim_table_seconds.return_value = [
-            pd.DataFrame({"a": [1, 2, 3]})
-        ]
+        mock_get_stim_table_seconds.return_value = [EXAMPLE_TABLE]
         mock_extract_blocks_from_stim.return_value = [1, 2, 3]
         mock_get_stimuli.return_value = {"stuff": "things"}
         mock_seconds_to_frames.return_value = np.array([1, 2, 3])
         mock_extract_frame_times_from_photodiode.return_value = [0.1, 0.2, 0.3]
-        mock_create_stim_table.return_value = pd.DataFrame({"a": [1, 2, 3]})
-        mock_map_column_names.return_value = pd.DataFrame({"a": [1, 2, 3]})
+        mock_create_stim_table.return_value = EXAMPLE_TABLE
+        mock_map_column_names.return_value = EXAMPLE_TABLE
 
         # Call the method
         self.camstim.build_stimulus_table()
@@ -153,7 +149,15 @@ class TestCamstim(unittest.TestCase):
         mock_extract_frame_times_from_photodiode.assert_called_once()
         mock_create_stim_table.assert_called_once()
         mock_map_column_names.assert_called_once()
-        mock_to_csv.assert_called_once_with(
+        mock_write_stim_table.assert_called_once_with(EXAMPLE_TABLE)
+
+    def test_write_stim_table(self):
+        """Test the _write_stim_table method"""
+        stim_table = MagicMock(spec=pd.DataFrame)
+
+        self.camstim._write_stim_table(stim_table)
+
+        stim_table.to_csv.assert_called_once_with(
             self.camstim.stim_table_path, index=False
         )
 
@@ -184,6 +188,46 @@ class TestCamstim(unittest.TestCase):
         # Assert the result
         self.assertEqual(epochs, expected_epochs)
 
+    def test_extract_stim_epochs_with_nans(self):
+        """Test the extract_stim_epochs method with NaN names and params"""
+        # Create a mock stimulus table with a run of NaN stim names and
+        # NaN parameter values
+        data = {
+            "start_time": [0, 1, 2, 3, 4, 5],
+            "stop_time": [1, 2, 3, 4, 5, 6],
+            "stim_name": ["stim1", np.nan, np.nan, "movie1", "movie1", "s2"],
+            "stim_type": ["type1"] * 6,
+            "frame": [0, 1, 2, 3, 4, 5],
+            "param1": ["a", np.nan, "b", np.nan, "c", "d"],
+            "param2": [1.0, 2.0, np.nan, 3.0, 3.0, np.nan],
+        }
+        stim_table = pd.DataFrame(data)
+
+        # Expected output: NaN names never equal each other, so every NaN
+        # row is its own epoch, and NaN parameter values are dropped
+        expected_names = ["stim1", None, None, "movie1"]
+        expected_epochs = [
+            [0, 1, {"param1": {"a"}, "param2": {1.0}}, set()],
+            [1, 2, {"param1": set(), "param2": {2.0}}, set()],
+            [2, 3, {"param1": {"b"}, "param2": set()}, set()],
+            [3, 5, {"param1": {"c"}, "param2": {3.0}}, {"movie1"}],
+        ]
+
+        # Call the method, on both a default and a non-default index
+        for index in (None, range(10, 16)):
+            with self.subTest(index=index):
+                if index is not None:
+                    stim_table.index = index
+                epochs = self.camstim.extract_stim_epochs(stim_table)
+                names = [
+                    None if pd.isnull(epoch[0]) else epoch[0]
+                    for epoch in epochs
+                ]
+                self.assertEqual(expected_names, names)
+                self.assertEqual(
+                    expected_epochs, [epoch[1:] for epoch in epochs]
+                )
+
     def test_extract_stim_epochs_with_images_and_movies(self):
         """Test the extract_stim_epochs method with images and movies"""
         # Create a mock stimulus table with images and movies
@@ -281,18 +325,12 @@ class TestCamstim(unittest.TestCase):
     ):
         """Test the get_stim_table_seconds method"""
         # Mock the return values
-        mock_convert_frames_to_seconds.return_value = pd.DataFrame(
-            {"a": [1, 2, 3]}
-        )
-        mock_collapse_columns.return_value = pd.DataFrame({"a": [1, 2, 3]})
-        mock_drop_empty_columns.return_value = pd.DataFrame({"a": [1, 2, 3]})
-        mock_standardize_movie_numbers.return_value = pd.DataFrame(
-            {"a": [1, 2, 3]}
-        )
-        mock_add_number_to_shuffled_movie.return_value = pd.DataFrame(
-            {"a": [1, 2, 3]}
-        )
-        mock_map_stimulus_names.return_value = pd.DataFrame({"a": [1, 2, 3]})
+        mock_convert_frames_to_seconds.return_value = EXAMPLE_TABLE
+        mock_collapse_columns.return_value = EXAMPLE_TABLE
+        mock_drop_empty_columns.return_value = EXAMPLE_TABLE
+        mock_standardize_movie_numbers.return_value = EXAMPLE_TABLE
+        mock_add_number_to_shuffled_movie.return_value = EXAMPLE_TABLE
+        mock_map_stimulus_names.return_value = EXAMPLE_TABLE
 
         # Call the method
         stim_table_sweeps = pd.DataFrame({"frame": [1, 2, 3]})